@@ -760,29 +760,30 @@ def _diff_json_artifact(
             messages.append(f"JSON artifact path is a directory: {actual_path}")
             continue
 
-        actual_text = actual_path.read_text(encoding="utf-8")
-        generated_text = generated_path.read_text(encoding="utf-8")
-        if actual_text != generated_text:
-            messages.append(f"JSON artifact differs: {actual_path}")
-            diff_outputs.append(
-                (
-                    str(actual_path),
-                    _build_unified_diff(
-                        actual_text,
-                        generated_text,
+        if not _files_identical(actual_path, generated_path):
+            actual_text = actual_path.read_text(encoding="utf-8")
+            generated_text = generated_path.read_text(encoding="utf-8")
+            if actual_text != generated_text:
+                messages.append(f"JSON artifact differs: {actual_path}")
+                diff_outputs.append(
+                    (
                         str(actual_path),
-                        f"{actual_path} (generated)",
-                    ),
+                        _build_unified_diff(
+                            actual_text,
+                            generated_text,
+                            str(actual_path),
+                            f"{actual_path} (generated)",
+                        ),
+                    )
                 )
-            )
-            messages.extend(
-                _json_field_hints(
-                    actual_text,
-                    generated_text,
-                    jsonl=options.jsonl,
+                messages.extend(
+                    _json_field_hints(
+                        actual_text,
+                        generated_text,
+                        jsonl=options.jsonl,
+                    )
                 )
-            )
-            messages.extend(_constraint_failure_hints(constraint_summary))
+                messages.extend(_constraint_failure_hints(constraint_summary))
 
         expected_names = {path.name for path in generated_paths}
         suffix = ".jsonl" if options.jsonl else ".json"
@@ -1361,6 +1362,20 @@ def _render_reports(
         typer.secho("All compared artifacts match.", fg=typer.colors.GREEN)
 
 
+def _files_identical(left: Path, right: Path, *, chunk_size: int = 1 << 16) -> bool:
+    """Compare two files chunk by chunk so matching artifacts are never fully loaded."""
+
+    if left.stat().st_size != right.stat().st_size:
+        return False
+    with left.open("rb") as left_stream, right.open("rb") as right_stream:
+        while True:
+            left_chunk = left_stream.read(chunk_size)
+            if left_chunk != right_stream.read(chunk_size):
+                return False
+            if not left_chunk:
+                return True
+
+
 def _build_unified_diff(
     original: str,
     regenerated: str,
@@ -432,6 +432,21 @@ def _ci_workflow_content() -> str:
     )
 
 
+def _scaffold_files(ctx: PluginContext) -> dict[Path, str]:
+    """Render every scaffold file keyed by its path relative to the target directory."""
+
+    src_dir = Path("src", *ctx.package_parts)
+    return {
+        Path("pyproject.toml"): _pyproject_content(ctx),
+        Path("README.md"): _readme_content(ctx),
+        src_dir / "__init__.py": _package_init_content(ctx),
+        src_dir / "providers.py": _providers_content(ctx),
+        src_dir / "plugin.py": _plugin_content(ctx),
+        Path("tests", "test_plugin.py"): _tests_content(ctx),
+        Path(".github", "workflows", "ci.yml"): _ci_workflow_content(),
+    }
+
+
 @app.command()
 def new(  # noqa: PLR0913 - CLI command surfaces multiple knobs
     name: str = NAME_ARGUMENT,
@@ -461,26 +476,12 @@ def new(  # noqa: PLR0913 - CLI command surfaces multiple knobs
 
     _ensure_directory(context.target, force=force)
 
-    src_dir = context.target / "src" / Path(*context.package_parts)
-    tests_dir = context.target / "tests"
-    workflow_path = context.target / ".github" / "workflows"
-
-    src_dir.mkdir(parents=True, exist_ok=True)
-    tests_dir.mkdir(parents=True, exist_ok=True)
-    workflow_path.mkdir(parents=True, exist_ok=True)
+    files = {context.target / path: content for path, content in _scaffold_files(context).items()}
+    for directory_path in dict.fromkeys(path.parent for path in files):
+        directory_path.mkdir(parents=True, exist_ok=True)
 
     actions: list[str] = []
 
-    files = {
-        context.target / "pyproject.toml": _pyproject_content(context),
-        context.target / "README.md": _readme_content(context),
-        src_dir / "__init__.py": _package_init_content(context),
-        src_dir / "providers.py": _providers_content(context),
-        src_dir / "plugin.py": _plugin_content(context),
-        tests_dir / "test_plugin.py": _tests_content(context),
-        workflow_path / "ci.yml": _ci_workflow_content(),
-    }
-
     for path, content in files.items():
         result = _write_file(path, content, force=force)
         if result.wrote:
@@ -22,7 +22,10 @@ def gather_default_watch_paths(
     output: Path | None = None,
     extra: Iterable[Path] | None = None,
 ) -> list[Path]:
-    """Collect filesystem locations to monitor for change events."""
+    """Collect filesystem locations to monitor for change events.
+
+    Returned paths are resolved and de-duplicated, so callers can test membership directly.
+    """
 
     paths: set[Path] = set()
     target = target.resolve()
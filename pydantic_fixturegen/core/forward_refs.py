@@ -97,6 +97,7 @@ class _ForwardRefRegistry:
     def __init__(self) -> None:
         self._targets: dict[str, _ForwardRefTarget] = {}
         self._cache: dict[str, type[Any]] = {}
+        self.generation = 0
 
     def configure(self, entries: Sequence[ForwardRefEntry]) -> None:
         targets: dict[str, _ForwardRefTarget] = {}
@@ -112,6 +113,7 @@ class _ForwardRefRegistry:
             cache[alias] = target.resolve()
         self._targets = targets
         self._cache = cache
+        self.generation += 1
 
     def resolve(self, name: str) -> type[Any] | None:
         if not name:
@@ -145,11 +147,18 @@ def resolve_forward_ref(name: str) -> type[Any] | None:
     return _REGISTRY.resolve(name)
 
 
+def forward_refs_generation() -> int:
+    """Return a counter that changes whenever forward references are reconfigured."""
+
+    return _REGISTRY.generation
+
+
 __all__ = [
     "ForwardRefEntry",
     "ForwardReferenceError",
     "ForwardReferenceConfigurationError",
     "ForwardReferenceResolutionError",
     "configure_forward_refs",
+    "forward_refs_generation",
     "resolve_forward_ref",
 ]
@@ -16,6 +16,14 @@ from pydantic_fixturegen.core.schema import FieldConstraints, FieldSummary
 _SEGMENT_CHARS = string.ascii_lowercase + string.digits
 _WINDOWS_DRIVES = tuple("CDEFGHIJKLMNOPQRSTUVWXYZ")
 _FILE_EXTENSIONS = ("txt", "log", "json", "yaml", "csv", "cfg", "ini", "data")
+_POSIX_HOME = PurePosixPath("/home")
+_POSIX_ROOTS = (
+    PurePosixPath("/var"),
+    PurePosixPath("/usr/local"),
+    PurePosixPath("/opt"),
+    PurePosixPath("/srv"),
+    _POSIX_HOME,
+)
 
 _PathBuilder = Callable[[random.Random, str], PurePath]
 
@@ -61,16 +69,8 @@ def _determine_kind(summary: FieldSummary) -> str:
 
 
 def _build_posix_path(rng: random.Random, kind: str) -> PurePath:
-    base = rng.choice(
-        (
-            PurePosixPath("/var"),
-            PurePosixPath("/usr/local"),
-            PurePosixPath("/opt"),
-            PurePosixPath("/srv"),
-            PurePosixPath("/home"),
-        )
-    )
-    if base == PurePosixPath("/home"):
+    base = rng.choice(_POSIX_ROOTS)
+    if base == _POSIX_HOME:
         base = base / _posix_segment(rng)
     segment_count = rng.randint(1, 3)
     segments = [_posix_segment(rng) for _ in range(segment_count)]
@@ -62,11 +62,11 @@ class ProviderRegistry:
 
     # ------------------------------------------------------------------ lookup
     def get(self, type_id: str, format: str | None = None) -> ProviderRef | None:
-        key = (type_id, format)
-        if key in self._providers:
-            return self._providers[key]
-        fallback_key = (type_id, None)
-        return self._providers.get(fallback_key)
+        providers = self._providers
+        ref = providers.get((type_id, format))
+        if ref is None and format is not None:
+            ref = providers.get((type_id, None))
+        return ref
 
     def available(self) -> Iterable[ProviderRef]:
         return self._providers.values()
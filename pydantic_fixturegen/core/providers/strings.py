@@ -7,13 +7,6 @@ import random
 from types import ModuleType
 from typing import Any
 
-try:  # Optional dependency for regex generation
-    import rstr as _rstr
-except ImportError:  # pragma: no cover - optional extra not installed
-    rstr: ModuleType | None = None
-else:
-    rstr = _rstr
-
 from faker import Faker
 
 from pydantic_fixturegen.core.providers import ProviderRegistry
@@ -23,6 +16,23 @@ DEFAULT_MIN_CHARS = 1
 DEFAULT_MAX_CHARS = 16
 
 
+_MODULE_CACHE: dict[str, ModuleType | None] = {}
+
+
+def _load_rstr() -> ModuleType | None:
+    """Import the optional ``rstr`` dependency on first regex use and cache the result."""
+
+    if "rstr" in _MODULE_CACHE:
+        return _MODULE_CACHE["rstr"]
+    module: ModuleType | None
+    try:
+        import rstr as module
+    except ImportError:  # pragma: no cover - optional extra not installed
+        module = None
+    _MODULE_CACHE["rstr"] = module
+    return module
+
+
 def generate_string(
     summary: FieldSummary,
     *,
@@ -66,6 +76,7 @@ def register_string_providers(registry: ProviderRegistry) -> None:
 def _regex_string(summary: FieldSummary, *, faker: Faker) -> str:
     pattern = summary.constraints.pattern or ".*"
     candidate: str | None = None
+    rstr = _load_rstr()
     if rstr is not None:
         if hasattr(rstr, "Xeger"):
             candidate = rstr.Xeger(_random=faker.random).xeger(pattern)
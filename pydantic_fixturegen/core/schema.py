@@ -21,7 +21,7 @@ from pydantic_core import PydanticUndefined
 from typing_extensions import NotRequired, Required
 
 from pydantic_fixturegen.core.extra_types import resolve_type_id
-from pydantic_fixturegen.core.forward_refs import resolve_forward_ref
+from pydantic_fixturegen.core.forward_refs import forward_refs_generation, resolve_forward_ref
 from pydantic_fixturegen.core.model_utils import (
     ensure_runtime_model,
     is_dataclass_type,
@@ -134,14 +134,41 @@ def summarize_field(field: FieldInfoLike) -> FieldSummary:
     return summary
 
 
+# Pydantic model summaries are stored on the class itself, next to the ``model_fields``
+# mapping they were built from (replaced by ``model_rebuild``) and the forward-ref
+# generation. Keeping them off a module-level mapping lets self-referencing models, whose
+# summaries point back at the class, be collected with it.
+_MODEL_SUMMARY_ATTR = "__pfg_field_summaries__"
+
+
 def summarize_model_fields(model: type[Any]) -> Mapping[str, FieldSummary]:
+    """Summarize every field of ``model``.
+
+    The result is a read-only mapping, cached per class for Pydantic models; treat the
+    contained summaries as immutable and use ``dataclasses.replace`` to derive variants.
+    """
+
+    model_fields = getattr(model, "model_fields", None)
+    if not isinstance(model_fields, Mapping):
+        return _summarize_field_map(model)
+
+    generation = forward_refs_generation()
+    # Read from the class ``__dict__`` so subclasses never reuse a parent's entry.
+    cached = model.__dict__.get(_MODEL_SUMMARY_ATTR)
+    if cached is not None and cached[0] is model_fields and cached[1] == generation:
+        return cast(Mapping[str, FieldSummary], cached[2])
+    summary = types.MappingProxyType(
+        {name: summarize_field(field) for name, field in model_fields.items()}
+    )
+    setattr(model, _MODEL_SUMMARY_ATTR, (model_fields, generation, summary))
+    return summary
+
+
+def _summarize_field_map(model: type[Any]) -> Mapping[str, FieldSummary]:
     summary: dict[str, FieldSummary] = {}
     field_map: Mapping[str, FieldInfo | _SimpleFieldInfo]
 
-    model_fields = getattr(model, "model_fields", None)
-    if isinstance(model_fields, Mapping):
-        field_map = model_fields
-    elif is_dataclass_type(model):
+    if is_dataclass_type(model):
         field_map = _dataclass_field_info_map(model)
     elif is_typeddict_type(model):
         field_map = _typeddict_field_info_map(model)
@@ -150,7 +177,7 @@ def summarize_model_fields(model: type[Any]) -> Mapping[str, FieldSummary]:
 
     for name, field in field_map.items():
         summary[name] = summarize_field(field)
-    return summary
+    return types.MappingProxyType(summary)
 
 
 def _dataclass_field_info_map(model: type[Any]) -> Mapping[str, _SimpleFieldInfo]:
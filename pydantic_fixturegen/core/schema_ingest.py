@@ -14,12 +14,29 @@ from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from importlib import metadata
 from pathlib import Path
 from typing import Any, cast
 
 from .errors import DiscoveryError
 
-_DCG_VERSION = "unavailable"
+_DCG_VERSION: str | None = None
+
+
+def _installed_dcg_version() -> str:
+    """Return the datamodel-code-generator version used in cache keys, without importing it.
+
+    Reading distribution metadata keeps keys identical across processes, so modules
+    generated by an earlier run are reused until the generator is upgraded.
+    """
+
+    global _DCG_VERSION
+    if _DCG_VERSION is None:
+        try:
+            _DCG_VERSION = metadata.version("datamodel-code-generator")
+        except metadata.PackageNotFoundError:
+            _DCG_VERSION = "unavailable"
+    return _DCG_VERSION
 
 
 CACHE_ROOT = ".pfg-cache"
@@ -52,7 +69,7 @@ class SchemaIngester:
         self._sources_dir = base / SCHEMA_SOURCE_DIR
         self._modules_dir.mkdir(parents=True, exist_ok=True)
         self._sources_dir.mkdir(parents=True, exist_ok=True)
-        self._dcg_version = _DCG_VERSION
+        self._dcg_version = _installed_dcg_version()
 
     def ingest_json_schema(self, schema_path: Path) -> SchemaModule:
         """Materialise a JSON Schema document as a cached module."""
@@ -143,9 +160,6 @@ class SchemaIngester:
                     if kind is SchemaKind.OPENAPI
                     else dcg.InputFileType.JsonSchema
                 )
-                global _DCG_VERSION
-                _DCG_VERSION = getattr(dcg, "__version__", "unknown")
-                self._dcg_version = _DCG_VERSION
                 dcg.generate(
                     input_=input_path,
                     input_file_type=file_type,
@@ -71,7 +71,8 @@ class Logger:
         if level_value < self.config.level:
             return
 
-        payload_context = dict(extras)
+        # ``extras`` is already a fresh dict owned by this call; no need to copy it.
+        payload_context = extras
         event_name = payload_context.pop("event", message)
 
         if self.config.json:
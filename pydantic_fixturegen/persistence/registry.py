@@ -6,6 +6,7 @@ import importlib
 import inspect
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
 from types import MappingProxyType
 from typing import Any
 
@@ -25,7 +26,7 @@ from .models import HandlerKind
 HandlerFactoryFunc = Callable[[Mapping[str, Any]], Any]
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class PersistenceHandlerFactory:
     """Descriptor for a registered persistence handler."""
 
@@ -140,6 +141,7 @@ class PersistenceRegistry:
         )
 
 
+@lru_cache(maxsize=256)
 def _resolve_target(path: str) -> Any:
     if not path:
         raise ValueError("Handler paths must be non-empty.")
@@ -102,7 +102,8 @@ class PersistenceRunner:
                 stats.record_retry()
                 if attempt > self.max_retries:
                     raise self._failure_error(batch, attempt, exc) from exc
-                time.sleep(self.retry_wait)
+                if self.retry_wait > 0:
+                    time.sleep(self.retry_wait)
                 continue
             stats.record_batch(len(batch))
             self.logger.info(
@@ -164,23 +165,19 @@ class PersistenceRunner:
         )
 
     def _iter_batches(self) -> Iterator[Sequence[PersistenceRecord]]:
-        records_remaining = self.count
-        case_index = 1
-        while records_remaining > 0:
-            chunk = min(self.batch_size, records_remaining)
-            batch: list[PersistenceRecord] = []
-            for _ in range(chunk):
-                payload = self.sample_factory()
-                batch.append(
-                    PersistenceRecord(
-                        model=self.model_cls.__qualname__,
-                        payload=dict(payload),
-                        case_index=case_index,
-                    )
+        # Each batch is a fresh list: handlers may keep a reference to what they receive.
+        model_name = self.model_cls.__qualname__
+        sample_factory = self.sample_factory
+        for start in range(0, self.count, self.batch_size):
+            stop = min(start + self.batch_size, self.count)
+            yield [
+                PersistenceRecord(
+                    model=model_name,
+                    payload=dict(sample_factory()),
+                    case_index=index + 1,
                 )
-                case_index += 1
-            records_remaining -= chunk
-            yield batch
+                for index in range(start, stop)
+            ]
 
     # ------------------------------------------------------------------ util
     @staticmethod
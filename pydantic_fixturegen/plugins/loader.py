@@ -33,7 +33,11 @@ def load_entrypoint_plugins(
     *,
     force: bool = False,
 ) -> list[Any]:
-    """Load plugins declared via entry points."""
+    """Load plugins declared via entry points.
+
+    Each group is scanned once per process; later calls return an empty list unless
+    ``force`` is set, which rescans the installed distributions.
+    """
 
     if group in _loaded_groups and not force:
         return []
@@ -12,7 +12,10 @@ from .snapshot import SnapshotResult, SnapshotRunner, SnapshotUpdateMode
 
 UPDATE_OPTION_NAME: Final = "pfg_update_snapshots"
 SNAPSHOT_MARKER_NAME: Final = "pfg_snapshot_config"
-_RUNNER_OVERRIDE_FIELDS: Final = {"timeout", "memory_limit_mb", "ast_mode", "hybrid_mode"}
+_RUNNER_OVERRIDE_FIELDS: Final = frozenset(
+    {"timeout", "memory_limit_mb", "ast_mode", "hybrid_mode"}
+)
+_MARKER_OPTION_NAMES: Final = _RUNNER_OVERRIDE_FIELDS | {"update"}
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -43,10 +46,11 @@ def pfg_snapshot(
     request: pytest.FixtureRequest,
 ) -> SnapshotRunner:
     marker_overrides = _get_marker_overrides(request)
-    option_value = pytestconfig.getoption(UPDATE_OPTION_NAME, default=None)
-    env_mode = os.getenv("PFG_SNAPSHOT_UPDATE")
     update_override = marker_overrides.pop("update", None)
-    mode = SnapshotUpdateMode.coerce(update_override or option_value or env_mode)
+    option_value = pytestconfig.getoption(UPDATE_OPTION_NAME, default=None)
+    mode = SnapshotUpdateMode.coerce(
+        update_override or option_value or os.environ.get("PFG_SNAPSHOT_UPDATE")
+    )
     runner = SnapshotRunner(update_mode=mode)
 
     for field, value in marker_overrides.items():
@@ -71,7 +75,7 @@ def _get_marker_overrides(request: pytest.FixtureRequest) -> dict[str, Any]:
     if "update" not in overrides and marker.args:
         overrides["update"] = marker.args[0]
 
-    unknown = set(overrides).difference(_RUNNER_OVERRIDE_FIELDS | {"update"})
+    unknown = overrides.keys() - _MARKER_OPTION_NAMES
     if unknown:
         joined = ", ".join(sorted(unknown))
         raise pytest.UsageError(f"Unknown {SNAPSHOT_MARKER_NAME} option(s): {joined}")
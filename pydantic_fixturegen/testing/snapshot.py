@@ -45,11 +45,10 @@ class SnapshotUpdateMode(Enum):
             return value
         if value is None:
             return cls.FAIL
-        normalized = value.strip().lower()
-        for mode in cls:
-            if mode.value == normalized:
-                return mode
-        raise ValueError(f"Unsupported snapshot update mode: {value!r}")
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            raise ValueError(f"Unsupported snapshot update mode: {value!r}") from None
 
     @classmethod
     def from_env(cls, env_var: str = "PFG_SNAPSHOT_UPDATE") -> SnapshotUpdateMode:
@@ -0,0 +1,14 @@
+"""Shared Polyfactory availability checks for tests."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic_fixturegen.polyfactory_support.discovery import (
+    POLYFACTORY_MODEL_FACTORY,
+    POLYFACTORY_UNAVAILABLE_REASON,
+)
+
+requires_polyfactory = pytest.mark.skipif(
+    POLYFACTORY_MODEL_FACTORY is None,
+    reason=POLYFACTORY_UNAVAILABLE_REASON or "polyfactory unavailable",
+)
@@ -15,6 +15,7 @@ from pydantic_fixturegen.cli.diff import (
     JsonDiffOptions,
     SchemaDiffOptions,
     _execute_diff,
+    _files_identical,
     _render_reports,
     _resolve_method,
 )
@@ -498,6 +499,21 @@ def test_render_reports_variants(monkeypatch: pytest.MonkeyPatch) -> None:
     assert logger.warn_calls == []  # render doesn't use logger.warn
 
 
+def test_files_identical_compares_in_chunks(tmp_path: Path) -> None:
+    left = tmp_path / "left.json"
+    right = tmp_path / "right.json"
+    left.write_bytes(b"a" * 10 + b"b")
+    right.write_bytes(b"a" * 10 + b"b")
+
+    assert _files_identical(left, right, chunk_size=4)
+
+    right.write_bytes(b"a" * 10 + b"c")
+    assert not _files_identical(left, right, chunk_size=4)
+
+    right.write_bytes(b"a" * 10)
+    assert not _files_identical(left, right, chunk_size=4)
+
+
 def test_resolve_method_validation() -> None:
     assert _resolve_method(False, False) == "import"
     assert _resolve_method(True, False) == "ast"
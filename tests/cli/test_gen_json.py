@@ -13,16 +13,8 @@ from pydantic_fixturegen.cli.gen import json as json_mod
 from pydantic_fixturegen.core.config import ConfigError
 from pydantic_fixturegen.core.errors import DiscoveryError, EmitError, MappingError, WatchError
 from pydantic_fixturegen.core.path_template import OutputTemplate
-from pydantic_fixturegen.polyfactory_support.discovery import (
-    POLYFACTORY_MODEL_FACTORY,
-    POLYFACTORY_UNAVAILABLE_REASON,
-)
 from tests._cli import create_cli_runner
-
-try:  # pragma: no cover
-    import polyfactory  # noqa: F401
-except Exception:  # pragma: no cover
-    polyfactory = None
+from tests._polyfactory import requires_polyfactory
 
 runner = create_cli_runner()
 
@@ -128,14 +120,11 @@ def _write_relative_import_package(tmp_path: Path) -> Path:
     return target_module
 
 
+@requires_polyfactory
 def test_gen_json_prefers_polyfactory_factories(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    if polyfactory is None:
-        pytest.skip("polyfactory unavailable")
-    if POLYFACTORY_MODEL_FACTORY is None:
-        pytest.skip(POLYFACTORY_UNAVAILABLE_REASON or "polyfactory unavailable")
     monkeypatch.setenv("PFG_POLYFACTORY__ENABLED", "true")
     monkeypatch.setenv("PFG_POLYFACTORY__PREFER_DELEGATION", "true")
     module_path = tmp_path / "models.py"
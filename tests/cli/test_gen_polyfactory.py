@@ -14,16 +14,8 @@ from pydantic.warnings import PydanticDeprecatedSince20
 from pydantic_fixturegen.cli import app as cli_app
 from pydantic_fixturegen.core.errors import DiscoveryError
 from pydantic_fixturegen.core.introspect import IntrospectedModel, IntrospectionResult
-from pydantic_fixturegen.polyfactory_support.discovery import (
-    POLYFACTORY_MODEL_FACTORY,
-    POLYFACTORY_UNAVAILABLE_REASON,
-)
 from tests._cli import create_cli_runner
-
-try:  # pragma: no cover - optional dependency
-    import polyfactory  # noqa: F401
-except Exception:  # pragma: no cover - allow tests to skip
-    polyfactory = None
+from tests._polyfactory import requires_polyfactory
 
 runner = create_cli_runner()
 
@@ -40,12 +32,8 @@ def _suppress_polyfactory_cli_exit(monkeypatch):
     return captured
 
 
+@requires_polyfactory
 def test_gen_polyfactory_exports_factories(tmp_path: Path) -> None:
-    if polyfactory is None:
-        pytest.skip("polyfactory unavailable")
-    if POLYFACTORY_MODEL_FACTORY is None:
-        pytest.skip(POLYFACTORY_UNAVAILABLE_REASON or "polyfactory unavailable")
-
     module_path = tmp_path / "models.py"
     module_path.write_text(
         """
@@ -238,12 +226,8 @@ def test_gen_polyfactory_watch_mode_invokes_runner(monkeypatch, tmp_path: Path)
     assert calls["paths"] == ["models.py"]
 
 
+@requires_polyfactory
 def test_gen_polyfactory_freeze_seeds(tmp_path: Path) -> None:
-    if polyfactory is None:
-        pytest.skip("polyfactory unavailable")
-    if POLYFACTORY_MODEL_FACTORY is None:
-        pytest.skip(POLYFACTORY_UNAVAILABLE_REASON or "polyfactory unavailable")
-
     module_path = tmp_path / "models.py"
     module_path.write_text(
         "from pydantic import BaseModel\nclass User(BaseModel):\n    name: str\n",
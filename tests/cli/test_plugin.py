@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 
@@ -13,10 +14,6 @@ plugin_app = plugin_mod.app
 runner = create_cli_runner()
 
 
-def _read(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
-
-
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
 
 
@@ -27,6 +24,31 @@ def _normalize_cli(text: str) -> str:
     return " ".join(stripped.replace("│", " ").split())
 
 
+def _collect_files(root: Path) -> set[str]:
+    return {
+        (Path(dirpath) / name).relative_to(root).as_posix()
+        for dirpath, _dirnames, filenames in os.walk(root)
+        for name in filenames
+    }
+
+
+def _render_scaffold(name: str, **overrides: str | None) -> dict[str, str]:
+    context = plugin_mod._build_context(
+        name=name,
+        directory=Path("unused"),
+        namespace=overrides.get("namespace"),
+        distribution=overrides.get("distribution"),
+        entrypoint=overrides.get("entrypoint"),
+        description=None,
+        author=None,
+        version=plugin_mod.DEFAULT_VERSION,
+        license_name=plugin_mod.DEFAULT_LICENSE,
+    )
+    return {
+        path.as_posix(): content for path, content in plugin_mod._scaffold_files(context).items()
+    }
+
+
 def test_plugin_scaffold_creates_expected_layout(tmp_path: Path) -> None:
     target = tmp_path / "demo"
     result = runner.invoke(plugin_app, ["--directory", str(target), "demo"])
@@ -34,24 +56,24 @@ def test_plugin_scaffold_creates_expected_layout(tmp_path: Path) -> None:
     assert result.exit_code == 0
     assert "Plugin scaffold created" in result.stdout
 
-    pyproject = target / "pyproject.toml"
-    providers = target / "src" / "demo" / "providers.py"
-    workflow = target / ".github" / "workflows" / "ci.yml"
+    files = _collect_files(target)
+    assert "pyproject.toml" in files
+    assert "README.md" in files
+    assert "tests/test_plugin.py" in files
+    assert "src/demo/providers.py" in files
+    assert ".github/workflows/ci.yml" in files
+
 
-    assert pyproject.is_file()
-    assert (target / "README.md").is_file()
-    assert (target / "tests" / "test_plugin.py").is_file()
-    assert providers.is_file()
-    assert workflow.is_file()
+def test_plugin_scaffold_renders_expected_content() -> None:
+    files = _render_scaffold("demo")
 
-    pyproject_content = _read(pyproject)
+    pyproject_content = files["pyproject.toml"]
     assert 'name = "pfg-demo"' in pyproject_content
     assert 'demo = "demo.plugin:plugin"' in pyproject_content
     assert '"pydantic-fixturegen>=' in pyproject_content
     assert '"pytest>=8.3"' in pyproject_content
 
-    workflow_content = _read(workflow)
-    assert "pytest" in workflow_content
+    assert "pytest" in files[".github/workflows/ci.yml"]
 
 
 def test_plugin_scaffold_supports_namespace_and_overrides(tmp_path: Path) -> None:
@@ -72,20 +94,20 @@ def test_plugin_scaffold_supports_namespace_and_overrides(tmp_path: Path) -> Non
     )
 
     assert result.exit_code == 0
+    assert (target / "src" / "acme" / "plugins" / "email" / "__init__.py").is_file()
 
-    package = target / "src" / "acme" / "plugins" / "email"
-    assert package.is_dir()
-    assert (package / "__init__.py").is_file()
-
-    tests_file = target / "tests" / "test_plugin.py"
-    content = _read(tests_file)
-    assert "from acme.plugins.email.plugin import plugin" in content
-
-    pyproject = _read(target / "pyproject.toml")
+    pyproject = (target / "pyproject.toml").read_text(encoding="utf-8")
     assert 'name = "acme-fixturegen-email"' in pyproject
     assert 'acme-email = "acme.plugins.email.plugin:plugin"' in pyproject
 
 
+def test_plugin_scaffold_renders_namespaced_imports() -> None:
+    files = _render_scaffold("email", namespace="acme.plugins")
+
+    assert "src/acme/plugins/email/__init__.py" in files
+    assert "from acme.plugins.email.plugin import plugin" in files["tests/test_plugin.py"]
+
+
 def test_existing_directory_without_force_errors(tmp_path: Path) -> None:
     target = tmp_path / "demo"
     target.mkdir()
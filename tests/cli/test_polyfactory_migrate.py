@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -11,53 +12,23 @@ from pydantic import BaseModel
 from pydantic_fixturegen.cli import app as cli_app
 from pydantic_fixturegen.core.errors import DiscoveryError
 from pydantic_fixturegen.polyfactory_support.discovery import (
-    POLYFACTORY_MODEL_FACTORY,
-    POLYFACTORY_UNAVAILABLE_REASON,
     PolyfactoryBinding,
 )
 from pydantic_fixturegen.polyfactory_support.migration import FactoryReport, FieldReport
 from tests._cli import create_cli_runner
-
-try:  # pragma: no cover - optional dependency used in an integration test below
-    import polyfactory  # type: ignore  # noqa: F401
-except Exception:  # pragma: no cover - allow the module to import so other tests run
-    polyfactory = None
+from tests._polyfactory import requires_polyfactory
 
 runner = create_cli_runner()
 
+POLYFACTORY_MODEL_SOURCE = Path(__file__).resolve().parents[1] / "fixtures" / "polyfactory_model.py"
+
 
+@requires_polyfactory
 def test_polyfactory_migrate_command(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    if polyfactory is None:
-        pytest.skip("polyfactory unavailable")
     module_path = tmp_path / "models_poly.py"
-    module_path.write_text(
-        """
-from pydantic import BaseModel
-from polyfactory.factories.pydantic_factory import ModelFactory
-from polyfactory.fields import Use, Ignore
-
-
-def slugify(prefix: str) -> str:
-    return f"{prefix}-slug"
-
-
-class Model(BaseModel):
-    slug: str
-    alias: str | None = None
-
-
-class ModelFactoryShim(ModelFactory[Model]):
-    __model__ = Model
-    __check_model__ = False
-    slug = Use(slugify, "fixture")
-    alias = Ignore()
-""",
-        encoding="utf-8",
-    )
+    shutil.copyfile(POLYFACTORY_MODEL_SOURCE, module_path)
 
     overrides_path = tmp_path / "overrides.toml"
-    if POLYFACTORY_MODEL_FACTORY is None and POLYFACTORY_UNAVAILABLE_REASON:
-        pytest.skip(POLYFACTORY_UNAVAILABLE_REASON)
     result = runner.invoke(
         cli_app,
         [
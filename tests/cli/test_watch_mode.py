@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import shutil
 import sys
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 import pytest
@@ -13,23 +14,17 @@ from tests._cli import create_cli_runner
 runner = create_cli_runner()
 
 
-def _write_model(tmp_path: Path) -> Path:
+@pytest.fixture
+def model_module(tmp_path: Path, item_model_path: Path) -> Path:
     module = tmp_path / "models.py"
-    module.write_text(
-        """
-from pydantic import BaseModel
-
-
-class Item(BaseModel):
-    value: int
-""",
-        encoding="utf-8",
-    )
+    shutil.copyfile(item_model_path, module)
     return module
 
 
-def test_watch_requires_watchfiles(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    module = _write_model(tmp_path)
+def test_watch_requires_watchfiles(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, model_module: Path
+) -> None:
+    module = model_module
     out = tmp_path / "out.json"
 
     def fake_import() -> None:
@@ -53,14 +48,18 @@ def test_watch_requires_watchfiles(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
     assert "watchfiles" in result.stdout or "watchfiles" in result.stderr
 
 
-def test_watch_triggers_rebuild(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    module = _write_model(tmp_path)
+def test_watch_triggers_rebuild(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, model_module: Path
+) -> None:
+    module = model_module
     out = tmp_path / "out.json"
 
     run_calls: list[int] = []
+    expected_parent = module.parent.resolve()
 
     def fake_run(run_once, watch_paths: Iterable[Path], debounce: float) -> None:  # type: ignore[override]
-        assert any(module.parent.resolve() == path.resolve() for path in watch_paths)
+        # gather_default_watch_paths already yields resolved paths.
+        assert expected_parent in watch_paths
         run_once()
         run_calls.append(1)
         run_once()
@@ -85,73 +84,73 @@ def test_watch_triggers_rebuild(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     assert len(run_calls) == 2
 
 
-def test_gather_default_watch_paths(tmp_path: Path) -> None:
-    module = _write_model(tmp_path)
+def test_gather_default_watch_paths(tmp_path: Path, model_module: Path) -> None:
+    module = model_module
     config = tmp_path / "pyproject.toml"
     config.write_text("[project]\nname='demo'\n", encoding="utf-8")
     output = tmp_path / "generated" / "out.json"
     output.parent.mkdir(parents=True, exist_ok=True)
     output.write_text("{}", encoding="utf-8")
     extra = tmp_path / "additional.cfg"
-    extra.write_text("", encoding="utf-8")
+    extra.touch()
 
     paths = watch_mod.gather_default_watch_paths(module, output=output, extra=[extra])
 
-    resolved = {path.resolve() for path in paths}
-    assert module.resolve() in resolved
-    assert module.parent.resolve() in resolved
-    assert (Path.cwd() / "pyproject.toml").resolve() in resolved
-    assert output.parent.resolve() in resolved
+    expected = {
+        module.resolve(),
+        module.parent.resolve(),
+        (Path.cwd() / "pyproject.toml").resolve(),
+        output.parent.resolve(),
+    }
+    assert expected <= set(paths)
 
 
+@pytest.mark.parametrize("batches", [1, 2])
 def test_run_with_watch_executes_multiple_times(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, model_module: Path, batches: int
 ) -> None:
-    module = _write_model(tmp_path)
+    events = (frozenset({(0, model_module)}),) * batches
 
-    def fake_backend(*paths: Path, debounce: float):  # type: ignore[override]
-        yield {(0, paths[0])}
-        yield {(0, paths[0])}
+    def fake_backend(*paths: Path, debounce: float) -> Iterator[frozenset[tuple[int, Path]]]:
+        return iter(events)
 
     monkeypatch.setattr(watch_mod, "_import_watch_backend", lambda: fake_backend)
 
     run_calls: list[int] = []
 
-    watch_mod.run_with_watch(lambda: run_calls.append(1), [module], debounce=0.1)
+    watch_mod.run_with_watch(lambda: run_calls.append(1), [model_module], debounce=0.1)
 
-    # initial call + one per change event
-    assert len(run_calls) == 3
+    # initial call + one per change batch
+    assert len(run_calls) == batches + 1
 
 
 def test_gather_watch_paths_handles_missing_target(tmp_path: Path) -> None:
     missing = tmp_path / "missing.py"
     paths = watch_mod.gather_default_watch_paths(missing)
-    resolved = {path.resolve() for path in paths}
-    assert missing.parent.resolve() in resolved
+    assert missing.parent.resolve() in paths
 
 
-def test_gather_watch_paths_handles_missing_extra(tmp_path: Path) -> None:
-    module = _write_model(tmp_path)
+def test_gather_watch_paths_handles_missing_extra(tmp_path: Path, model_module: Path) -> None:
+    module = model_module
     missing_extra = tmp_path / "missing" / "config.cfg"
 
     paths = watch_mod.gather_default_watch_paths(module, extra=[missing_extra])
 
-    resolved = {path.resolve() for path in paths}
-    assert module.parent.resolve() in resolved
+    assert module.parent.resolve() in paths
 
 
 def test_gather_watch_paths_no_valid_entries(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, model_module: Path
 ) -> None:
-    module = _write_model(tmp_path)
+    module = model_module
     monkeypatch.setattr(watch_mod, "_normalize_watch_paths", lambda _paths: [])
 
     with pytest.raises(WatchError):
         watch_mod.gather_default_watch_paths(module)
 
 
-def test_run_with_watch_requires_paths(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    module = _write_model(tmp_path)
+def test_run_with_watch_requires_paths(monkeypatch: pytest.MonkeyPatch, model_module: Path) -> None:
+    module = model_module
 
     def empty_backend(*_args: object, **_kwargs: object):
         return iter(())
@@ -164,9 +163,9 @@ def test_run_with_watch_requires_paths(monkeypatch: pytest.MonkeyPatch, tmp_path
 
 
 def test_run_with_watch_handles_keyboard_interrupt(
-    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    monkeypatch: pytest.MonkeyPatch, model_module: Path
 ) -> None:
-    module = _write_model(tmp_path)
+    module = model_module
 
     def interrupting_backend(*paths: Path, debounce: float):  # type: ignore[override]
         yield {(0, paths[0])}
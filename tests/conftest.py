@@ -3,6 +3,12 @@ from __future__ import annotations
 import sys
 import warnings
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pydantic_fixturegen.core.providers import ProviderRegistry
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
@@ -14,3 +20,30 @@ warnings.filterwarnings(
     message=r"The `update_forward_refs` method is deprecated; use `model_rebuild` instead\..*",
     category=Warning,
 )
+
+
+ITEM_MODEL_SOURCE = """
+from pydantic import BaseModel
+
+
+class Item(BaseModel):
+    value: int
+"""
+
+
+@pytest.fixture(scope="session")
+def item_model_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Materialize the canonical ``Item`` model module once per session."""
+
+    module = tmp_path_factory.mktemp("models") / "models.py"
+    module.write_text(ITEM_MODEL_SOURCE, encoding="utf-8")
+    return module
+
+
+@pytest.fixture(scope="session")
+def default_registry() -> ProviderRegistry:
+    """Built-in provider registry shared by tests that only perform lookups."""
+
+    from pydantic_fixturegen.core.providers import create_default_registry
+
+    return create_default_registry(load_plugins=False)
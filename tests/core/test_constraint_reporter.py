@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
 from pydantic import BaseModel, Field
 from pydantic_fixturegen.core import constraint_report as report_mod
 from pydantic_fixturegen.core.constraint_report import ConstraintReporter
@@ -18,39 +23,96 @@ class _Account(BaseModel):
     addresses: list[_Address]
 
 
-def test_constraint_reporter_records_failures() -> None:
-    reporter = ConstraintReporter()
-    summaries = summarize_model_fields(_User)
+_USER_SUMMARIES = summarize_model_fields(_User)
+_ACCOUNT_SUMMARIES = summarize_model_fields(_Account)
 
-    reporter.begin_model(_User)
-    reporter.record_field_attempt(_User, "age", summaries["age"])
-    reporter.record_field_value("age", 5)
-    reporter.finish_model(
-        _User,
-        success=False,
-        errors=[
-            {
+
+@dataclass(frozen=True)
+class _FailureScenario:
+    model: type[BaseModel]
+    summaries: Mapping[str, FieldSummary]
+    field: str
+    value: Any
+    error: dict[str, Any]
+    attempts: int
+    location: list[str]
+    failure_value: Any
+    hint: str
+
+
+_FAILURE_SCENARIOS = [
+    pytest.param(
+        _FailureScenario(
+            model=_User,
+            summaries=_USER_SUMMARIES,
+            field="age",
+            value=5,
+            error={
                 "loc": ("age",),
                 "msg": "Value must be greater than or equal to 18",
                 "type": "value_error.number.not_ge",
-            }
-        ],
+            },
+            attempts=1,
+            location=["age"],
+            failure_value=5,
+            hint="numeric bounds",
+        ),
+        id="scalar",
+    ),
+    pytest.param(
+        _FailureScenario(
+            model=_Account,
+            summaries=_ACCOUNT_SUMMARIES,
+            field="addresses",
+            value=[{"city": "NY"}],
+            error={
+                "loc": ("addresses", 0, "city"),
+                "msg": "ensure this value has at least 3 characters",
+                "type": "value_error.any_str.min_length",
+            },
+            attempts=0,
+            location=["addresses", "0", "city"],
+            failure_value="NY",
+            hint="string length",
+        ),
+        id="nested",
+    ),
+]
+
+
+@pytest.fixture
+def reporter() -> ConstraintReporter:
+    return ConstraintReporter()
+
+
+@pytest.mark.parametrize("scenario", _FAILURE_SCENARIOS)
+def test_constraint_reporter_records_failures(
+    reporter: ConstraintReporter, scenario: _FailureScenario
+) -> None:
+    reporter.begin_model(scenario.model)
+    reporter.record_field_attempt(
+        scenario.model, scenario.field, scenario.summaries[scenario.field]
     )
+    reporter.record_field_value(scenario.field, scenario.value)
+    reporter.finish_model(scenario.model, success=False, errors=[scenario.error])
 
+    assert reporter.has_failures()
     summary = reporter.summary()
     assert summary["total_failures"] == 1
-    model_entry = summary["models"][0]
-    field_entry = model_entry["fields"][0]
-    assert field_entry["name"] == "age"
-    assert field_entry["attempts"] == 1
+    field_entry = summary["models"][0]["fields"][0]
+    assert field_entry["name"] == scenario.field
+    assert field_entry["attempts"] == scenario.attempts
     assert field_entry["successes"] == 0
-    assert field_entry["failures"][0]["hint"]
+    failure = field_entry["failures"][0]
+    assert failure["location"] == scenario.location
+    assert failure["value"] == scenario.failure_value
+    assert scenario.hint in failure["hint"]
 
 
 def test_constraint_reporter_merge() -> None:
     reporter_one = ConstraintReporter()
     reporter_two = ConstraintReporter()
-    summaries = summarize_model_fields(_User)
+    summaries = _USER_SUMMARIES
 
     reporter_one.begin_model(_User)
     reporter_one.record_field_attempt(_User, "age", summaries["age"])
@@ -78,37 +140,10 @@ def test_constraint_reporter_merge() -> None:
     assert summary["total_failures"] == 1
 
 
-def test_constraint_reporter_records_nested_failure_value() -> None:
-    reporter = ConstraintReporter()
-    summaries = summarize_model_fields(_Account)
-
-    reporter.begin_model(_Account)
-    reporter.record_field_attempt(_Account, "addresses", summaries["addresses"])
-    reporter.record_field_value("addresses", [{"city": "NY"}])
-    reporter.finish_model(
-        _Account,
-        success=False,
-        errors=[
-            {
-                "loc": ("addresses", 0, "city"),
-                "msg": "ensure this value has at least 3 characters",
-                "type": "value_error.any_str.min_length",
-            }
-        ],
-    )
-
-    assert reporter.has_failures()
-    summary = reporter.summary()
-    failure = summary["models"][0]["fields"][0]["failures"][0]
-    assert failure["location"] == ["addresses", "0", "city"]
-    assert failure["value"] == "NY"
-    assert "string length" in failure["hint"]
-
-
 def test_constraint_reporter_merge_prefers_constraints() -> None:
     reporter_base = ConstraintReporter()
     reporter_other = ConstraintReporter()
-    summaries = summarize_model_fields(_User)
+    summaries = _USER_SUMMARIES
 
     reporter_base.begin_model(_User)
     reporter_base.finish_model(
@@ -160,7 +195,7 @@ def test_hint_for_error_branches() -> None:
 
 def test_constraint_reporter_handles_empty_stack() -> None:
     reporter = ConstraintReporter()
-    summaries = summarize_model_fields(_User)
+    summaries = _USER_SUMMARIES
 
     reporter.record_field_attempt(_User, "age", summaries["age"])
     reporter.record_field_value("age", 21)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
 from types import ModuleType
 
 import pytest
@@ -15,7 +16,9 @@ from pydantic_fixturegen.core.forward_refs import (
 
 
 @pytest.fixture(autouse=True)
-def clear_registry() -> None:
+def clear_registry() -> Iterator[None]:
+    configure_forward_refs(())
+    yield
     configure_forward_refs(())
 
 
@@ -17,6 +17,8 @@ def sample_post(value: str, context: overrides_mod.FieldOverrideContext, suffix:
 
 NON_CALLABLE = "static"
 
+_FAKER = Faker()
+
 
 def _context() -> overrides_mod.FieldOverrideContext:
     return overrides_mod.FieldOverrideContext(
@@ -24,7 +26,7 @@ def _context() -> overrides_mod.FieldOverrideContext:
         field_name="name",
         alias=None,
         summary=None,
-        faker=Faker(),
+        faker=_FAKER,
         random=random.Random(0),
         values={},
         path="Model.name",
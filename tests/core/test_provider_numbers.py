@@ -14,13 +14,12 @@ def _summary(type_name: str, **kwargs: object) -> FieldSummary:
 
 
 def test_generate_numeric_bool_respects_random_choice(monkeypatch: pytest.MonkeyPatch) -> None:
+    summary = _summary("bool")
     rng = random.Random()
     sequence = [True, False, True]
     monkeypatch.setattr(rng, "choice", lambda options: sequence.pop(0))
 
-    values = [
-        numbers_mod.generate_numeric(_summary("bool"), random_generator=rng) for _ in range(3)
-    ]
+    values = [numbers_mod.generate_numeric(summary, random_generator=rng) for _ in range(3)]
 
     assert values == [True, False, True]
 
@@ -28,10 +27,10 @@ def test_generate_numeric_bool_respects_random_choice(monkeypatch: pytest.Monkey
 def test_generate_numeric_int_constraints() -> None:
     summary = _summary("int", ge=5, lt=8)
     rng = random.Random(0)
-    values = {numbers_mod.generate_numeric(summary, random_generator=rng) for _ in range(10)}
+    values = [numbers_mod.generate_numeric(summary, random_generator=rng) for _ in range(10)]
 
-    assert values <= {5, 6, 7}
-    assert values >= {5}
+    assert set(values) <= {5, 6, 7}
+    assert 5 in values
 
 
 def test_generate_numeric_float_with_bounds() -> None:
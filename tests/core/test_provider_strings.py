@@ -44,13 +44,9 @@ def test_generate_string_respects_length_bounds() -> None:
 def test_generate_string_pattern_uses_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
     summary = _summary(pattern="^abc.*$")
     faker = DummyFaker(responses=("suffix",))
-    original_rstr = getattr(strings_mod, "rstr", None)
-    monkeypatch.setattr(strings_mod, "rstr", None, raising=False)
+    monkeypatch.setitem(strings_mod._MODULE_CACHE, "rstr", None)
 
-    try:
-        result = strings_mod.generate_string(summary, faker=faker)
-    finally:
-        monkeypatch.setattr(strings_mod, "rstr", original_rstr, raising=False)
+    result = strings_mod.generate_string(summary, faker=faker)
 
     assert result.startswith("abc")
     # Fallback should pad using faker output
@@ -11,21 +11,31 @@ from faker import Faker
 from pydantic import BaseModel, SecretBytes, SecretStr
 from pydantic_fixturegen.core import schema as schema_module
 from pydantic_fixturegen.core.config import IdentifierConfig, PathConfig
-from pydantic_fixturegen.core.providers import (
-    ProviderRef,
-    ProviderRegistry,
-    create_default_registry,
-)
+from pydantic_fixturegen.core.providers import ProviderRef, ProviderRegistry
 from pydantic_fixturegen.core.providers import strings as strings_module
-from pydantic_fixturegen.core.providers.collections import register_collection_providers
-from pydantic_fixturegen.core.providers.identifiers import register_identifier_providers
-from pydantic_fixturegen.core.providers.numbers import register_numeric_providers
-from pydantic_fixturegen.core.providers.paths import register_path_providers
-from pydantic_fixturegen.core.providers.strings import register_string_providers
-from pydantic_fixturegen.core.providers.temporal import register_temporal_providers
 from pydantic_fixturegen.core.schema import FieldConstraints, FieldSummary
+from pydantic_fixturegen.plugins import loader as loader_mod
 from pydantic_fixturegen.plugins.hookspecs import hookimpl
 
+_FAKER = Faker()
+
+
+def _seeded_faker(seed: int) -> Faker:
+    """Reseed the shared Faker instead of paying for a fresh instance per call."""
+
+    _FAKER.seed_instance(seed)
+    return _FAKER
+
+
+_RNG = random.Random()
+
+
+def _seeded_rng(seed: int) -> random.Random:
+    """Reseed the shared generator so every call starts from the same state for ``seed``."""
+
+    _RNG.seed(seed)
+    return _RNG
+
 
 def test_register_and_lookup_provider() -> None:
     registry = ProviderRegistry()
@@ -83,6 +93,14 @@ def test_register_plugin_invokes_hook() -> None:
     assert provider.func(None) == 42
 
 
+def test_provider_registries_share_plugin_manager() -> None:
+    first = ProviderRegistry()
+    second = ProviderRegistry()
+
+    assert first._plugin_manager is second._plugin_manager
+    assert first._plugin_manager is loader_mod.get_plugin_manager()
+
+
 def test_load_entrypoint_plugins_handles_missing_group(monkeypatch: pytest.MonkeyPatch) -> None:
     registry = ProviderRegistry()
 
@@ -109,37 +127,52 @@ def test_load_entrypoint_plugins_handles_missing_group(monkeypatch: pytest.Monke
     assert bool_provider.func(None) is True
 
 
+def test_load_entrypoint_plugins_scans_group_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    scanned: list[str] = []
+
+    class DummyEntryPoints:
+        @staticmethod
+        def select(group: str) -> list[object]:
+            scanned.append(group)
+            return []
+
+    monkeypatch.setattr(loader_mod, "_loaded_groups", set())
+    monkeypatch.setattr("importlib.metadata.entry_points", lambda: DummyEntryPoints())
+
+    assert loader_mod.load_entrypoint_plugins() == []
+    assert loader_mod.load_entrypoint_plugins() == []
+    assert scanned == ["pydantic_fixturegen"]
+
+    loader_mod.load_entrypoint_plugins(force=True)
+    assert scanned == ["pydantic_fixturegen", "pydantic_fixturegen"]
+
+
 class SecretsExample(BaseModel):
     token: SecretBytes
     password: SecretStr
 
 
-def test_string_provider_respects_constraints() -> None:
-    registry = ProviderRegistry()
-    register_string_providers(registry)
-
+def test_string_provider_respects_constraints(default_registry: ProviderRegistry) -> None:
     summary = FieldSummary(
         type="string",
         constraints=FieldConstraints(min_length=5, pattern="^FIX"),
         format=None,
     )
-    provider = registry.get("string")
+    provider = default_registry.get("string")
     assert provider is not None
 
-    faker = Faker(seed=1)
+    faker = _seeded_faker(1)
     value = provider.func(summary=summary, faker=faker)
     assert isinstance(value, str)
     assert value.startswith("FIX")
     assert len(value) >= 5
 
 
-def test_string_provider_formats() -> None:
-    registry = ProviderRegistry()
-    register_string_providers(registry)
-    provider = registry.get("string")
+def test_string_provider_formats(default_registry: ProviderRegistry) -> None:
+    provider = default_registry.get("string")
     assert provider is not None
 
-    faker = Faker(seed=2)
+    faker = _seeded_faker(2)
 
     plain_summary = FieldSummary(
         type="string",
@@ -149,96 +182,91 @@ def test_string_provider_formats() -> None:
     plain_value = provider.func(
         summary=plain_summary,
         faker=faker,
-        random_generator=random.Random(1),
+        random_generator=_seeded_rng(1),
     )
     assert 2 <= len(plain_value) <= 3
 
 
-def test_identifier_provider_formats() -> None:
-    registry = ProviderRegistry()
-    register_identifier_providers(registry)
-    provider = registry.get("email")
+def test_identifier_provider_formats(default_registry: ProviderRegistry) -> None:
+    provider = default_registry.get("email")
     assert provider is not None
 
-    faker = Faker(seed=3)
+    faker = _seeded_faker(3)
     email_value = provider.func(
         summary=FieldSummary(type="email", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(1),
+        random_generator=_seeded_rng(1),
     )
     assert "@" in email_value
 
-    card_provider = registry.get("payment-card")
+    card_provider = default_registry.get("payment-card")
     assert card_provider is not None
     card_value = card_provider.func(
         summary=FieldSummary(type="payment-card", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(2),
+        random_generator=_seeded_rng(2),
     )
     assert isinstance(card_value, str) and len(card_value) > 0
 
-    url_provider = registry.get("url")
+    url_provider = default_registry.get("url")
     assert url_provider is not None
     url_value = url_provider.func(
         summary=FieldSummary(type="url", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(3),
+        random_generator=_seeded_rng(3),
     )
     assert url_value.startswith("http")
 
-    secret_str_provider = registry.get("secret-str")
+    secret_str_provider = default_registry.get("secret-str")
     assert secret_str_provider is not None
     secret_str = secret_str_provider.func(
         summary=FieldSummary(type="secret-str", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(4),
+        random_generator=_seeded_rng(4),
     )
     assert isinstance(secret_str, SecretStr)
     assert len(secret_str.get_secret_value()) == IdentifierConfig().secret_str_length
 
-    secret_bytes_provider = registry.get("secret-bytes")
+    secret_bytes_provider = default_registry.get("secret-bytes")
     assert secret_bytes_provider is not None
     secret_bytes = secret_bytes_provider.func(
         summary=FieldSummary(type="secret-bytes", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(5),
+        random_generator=_seeded_rng(5),
     )
     assert isinstance(secret_bytes, SecretBytes)
     assert len(secret_bytes.get_secret_value()) > 0
     assert len(secret_bytes.get_secret_value()) == IdentifierConfig().secret_bytes_length
 
-    ip_provider = registry.get("ip-address")
+    ip_provider = default_registry.get("ip-address")
     assert ip_provider is not None
     ip_value = ip_provider.func(
         summary=FieldSummary(type="ip-address", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(6),
+        random_generator=_seeded_rng(6),
     )
     assert isinstance(ip_value, str)
 
-    ip_interface_provider = registry.get("ip-interface")
+    ip_interface_provider = default_registry.get("ip-interface")
     assert ip_interface_provider is not None
     ip_interface = ip_interface_provider.func(
         summary=FieldSummary(type="ip-interface", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(7),
+        random_generator=_seeded_rng(7),
     )
     assert "/" in ip_interface
 
-    ip_network_provider = registry.get("ip-network")
+    ip_network_provider = default_registry.get("ip-network")
     assert ip_network_provider is not None
     ip_network = ip_network_provider.func(
         summary=FieldSummary(type="ip-network", constraints=FieldConstraints()),
         faker=faker,
-        random_generator=random.Random(8),
+        random_generator=_seeded_rng(8),
     )
     assert "/" in ip_network
 
 
-def test_identifier_provider_respects_configuration() -> None:
-    registry = ProviderRegistry()
-    register_identifier_providers(registry)
-
+def test_identifier_provider_respects_configuration(default_registry: ProviderRegistry) -> None:
     identifier_config = IdentifierConfig(
         secret_str_length=8,
         secret_bytes_length=10,
@@ -248,75 +276,73 @@ def test_identifier_provider_respects_configuration() -> None:
     )
 
     secret_summary = FieldSummary(type="secret-str", constraints=FieldConstraints())
-    secret = registry.get("secret-str")
+    secret = default_registry.get("secret-str")
     assert secret is not None
     secret_value = secret.func(
         summary=secret_summary,
-        faker=Faker(seed=2),
-        random_generator=random.Random(9),
+        faker=_seeded_faker(2),
+        random_generator=_seeded_rng(9),
         identifier_config=identifier_config,
     )
     assert isinstance(secret_value, SecretStr)
     assert len(secret_value.get_secret_value()) == 8
 
-    secret_bytes = registry.get("secret-bytes")
+    secret_bytes = default_registry.get("secret-bytes")
     assert secret_bytes is not None
     token = secret_bytes.func(
         summary=FieldSummary(type="secret-bytes", constraints=FieldConstraints()),
-        faker=Faker(seed=3),
-        random_generator=random.Random(10),
+        faker=_seeded_faker(3),
+        random_generator=_seeded_rng(10),
         identifier_config=identifier_config,
     )
     assert isinstance(token, SecretBytes)
     assert len(token.get_secret_value()) == 10
 
-    url_provider = registry.get("url")
+    url_provider = default_registry.get("url")
     assert url_provider is not None
     url_value = url_provider.func(
         summary=FieldSummary(type="url", constraints=FieldConstraints()),
-        faker=Faker(seed=4),
-        random_generator=random.Random(11),
+        faker=_seeded_faker(4),
+        random_generator=_seeded_rng(11),
         identifier_config=identifier_config,
     )
     assert url_value.startswith("ftp://")
     assert "/" not in url_value[len("ftp://") :]
 
-    uuid_provider = registry.get("uuid")
+    uuid_provider = default_registry.get("uuid")
     assert uuid_provider is not None
     uuid_value = uuid_provider.func(
         summary=FieldSummary(type="uuid", constraints=FieldConstraints()),
-        faker=Faker(seed=5),
-        random_generator=random.Random(12),
+        faker=_seeded_faker(5),
+        random_generator=_seeded_rng(12),
         identifier_config=identifier_config,
     )
     assert uuid_value.version == 1
 
 
-def test_identifier_provider_requires_random_generator() -> None:
-    registry = ProviderRegistry()
-    register_identifier_providers(registry)
-    provider = registry.get("email")
+def test_identifier_provider_requires_random_generator(default_registry: ProviderRegistry) -> None:
+    provider = default_registry.get("email")
     assert provider is not None
 
     with pytest.raises(RuntimeError):
         provider.func(
             summary=FieldSummary(type="email", constraints=FieldConstraints()),
-            faker=Faker(seed=6),
+            faker=_seeded_faker(6),
         )
 
 
-def test_path_provider_generates_cross_platform_segments() -> None:
-    registry = ProviderRegistry()
-    register_path_providers(registry)
+def test_path_provider_generates_cross_platform_segments(
+    default_registry: ProviderRegistry,
+) -> None:
 
-    provider = registry.get("path")
+    provider = default_registry.get("path")
     assert provider is not None
 
     summary = FieldSummary(type="path", constraints=FieldConstraints())
 
     windows_value = provider.func(
         summary=summary,
-        random_generator=random.Random(13),
+        random_generator=_seeded_rng(13),
         path_config=PathConfig(default_os="windows"),
     )
     assert isinstance(windows_value, str)
@@ -324,23 +350,21 @@ def test_path_provider_generates_cross_platform_segments() -> None:
 
     posix_value = provider.func(
         summary=summary,
-        random_generator=random.Random(13),
+        random_generator=_seeded_rng(13),
         path_config=PathConfig(default_os="posix"),
     )
     assert posix_value.startswith("/")
 
     mac_value = provider.func(
         summary=summary,
-        random_generator=random.Random(13),
+        random_generator=_seeded_rng(13),
         path_config=PathConfig(default_os="mac"),
     )
     assert mac_value.startswith("/Users") or mac_value.startswith("/Applications")
 
 
-def test_numeric_provider_respects_bounds() -> None:
-    registry = ProviderRegistry()
-    register_numeric_providers(registry)
-    provider = registry.get("int")
+def test_numeric_provider_respects_bounds(default_registry: ProviderRegistry) -> None:
+    provider = default_registry.get("int")
     assert provider is not None
 
     summary = FieldSummary(
@@ -348,7 +372,7 @@ def test_numeric_provider_respects_bounds() -> None:
         constraints=FieldConstraints(ge=5, le=5),
         format=None,
     )
-    value = provider.func(summary=summary, random_generator=random.Random(0))
+    value = provider.func(summary=summary, random_generator=_seeded_rng(0))
     assert value == 5
 
     float_summary = FieldSummary(
@@ -356,11 +380,11 @@ def test_numeric_provider_respects_bounds() -> None:
         constraints=FieldConstraints(ge=1.5, le=2.5),
         format=None,
     )
-    float_provider = registry.get("float")
+    float_provider = default_registry.get("float")
     assert float_provider is not None
     float_value = float_provider.func(
         summary=float_summary,
-        random_generator=random.Random(1),
+        random_generator=_seeded_rng(1),
     )
     assert 1.5 <= float_value <= 2.5
 
@@ -373,40 +397,37 @@ def test_numeric_provider_respects_bounds() -> None:
         ),
         format=None,
     )
-    decimal_provider = registry.get("decimal")
+    decimal_provider = default_registry.get("decimal")
     assert decimal_provider is not None
     decimal_value = decimal_provider.func(
         summary=decimal_summary,
-        random_generator=random.Random(2),
+        random_generator=_seeded_rng(2),
     )
     assert decimal.Decimal("1.10") <= decimal_value <= decimal.Decimal("1.20")
     assert decimal_value.as_tuple().exponent == -2
 
-    bool_provider = registry.get("bool")
+    bool_provider = default_registry.get("bool")
     assert bool_provider is not None
     bool_value = bool_provider.func(
         summary=FieldSummary(type="bool", constraints=FieldConstraints()),
-        random_generator=random.Random(3),
+        random_generator=_seeded_rng(3),
     )
     assert isinstance(bool_value, bool)
 
 
-def test_collection_provider_generates_items() -> None:
-    registry = ProviderRegistry()
-    register_collection_providers(registry)
-
+def test_collection_provider_generates_items(default_registry: ProviderRegistry) -> None:
     summary = FieldSummary(
         type="list",
         constraints=FieldConstraints(min_length=2, max_length=4),
         format=None,
         item_type="int",
     )
-    list_provider = registry.get("list")
+    list_provider = default_registry.get("list")
     assert list_provider is not None
     values = list_provider.func(
         summary=summary,
-        faker=Faker(seed=10),
-        random_generator=random.Random(2),
+        faker=_seeded_faker(10),
+        random_generator=_seeded_rng(2),
     )
     assert 2 <= len(values) <= 4
     assert all(isinstance(v, int) for v in values)
@@ -417,12 +438,12 @@ def test_collection_provider_generates_items() -> None:
         format=None,
         item_type="float",
     )
-    set_provider = registry.get("set")
+    set_provider = default_registry.get("set")
     assert set_provider is not None
     set_values = set_provider.func(
         summary=set_summary,
-        faker=Faker(seed=11),
-        random_generator=random.Random(4),
+        faker=_seeded_faker(11),
+        random_generator=_seeded_rng(4),
     )
     assert isinstance(set_values, set)
     assert 1 <= len(set_values) <= 2
@@ -433,12 +454,12 @@ def test_collection_provider_generates_items() -> None:
         format=None,
         item_type="string",
     )
-    tuple_provider = registry.get("tuple")
+    tuple_provider = default_registry.get("tuple")
     assert tuple_provider is not None
     tuple_value = tuple_provider.func(
         summary=tuple_summary,
-        faker=Faker(seed=12),
-        random_generator=random.Random(5),
+        faker=_seeded_faker(12),
+        random_generator=_seeded_rng(5),
     )
     assert isinstance(tuple_value, tuple)
     assert len(tuple_value) == 1
@@ -449,49 +470,44 @@ def test_collection_provider_generates_items() -> None:
         format=None,
         item_type="int",
     )
-    mapping_provider = registry.get("mapping")
+    mapping_provider = default_registry.get("mapping")
     assert mapping_provider is not None
     mapping_value = mapping_provider.func(
         summary=mapping_summary,
-        faker=Faker(seed=13),
-        random_generator=random.Random(6),
+        faker=_seeded_faker(13),
+        random_generator=_seeded_rng(6),
     )
     assert isinstance(mapping_value, dict)
     assert len(mapping_value) == 1
     assert all(isinstance(v, int) for v in mapping_value.values())
 
 
-def test_default_registry_includes_providers() -> None:
-    registry = create_default_registry(load_plugins=False)
-    assert registry.get("string") is not None
-    assert registry.get("int") is not None
-    assert registry.get("list") is not None
-    assert registry.get("datetime") is not None
-    assert registry.get("email") is not None
-
+def test_default_registry_includes_providers(default_registry: ProviderRegistry) -> None:
+    assert default_registry.get("string") is not None
+    assert default_registry.get("int") is not None
+    assert default_registry.get("list") is not None
+    assert default_registry.get("datetime") is not None
+    assert default_registry.get("email") is not None
 
-def test_temporal_provider_outputs_types() -> None:
-    registry = ProviderRegistry()
-    from pydantic_fixturegen.core.providers.temporal import register_temporal_providers
 
-    register_temporal_providers(registry)
-    faker = Faker(seed=11)
+def test_temporal_provider_outputs_types(default_registry: ProviderRegistry) -> None:
+    faker = _seeded_faker(11)
 
-    datetime_provider = registry.get("datetime")
+    datetime_provider = default_registry.get("datetime")
     assert datetime_provider is not None
     dt = datetime_provider.func(
         summary=FieldSummary(type="datetime", constraints=FieldConstraints()), faker=faker
     )
     assert isinstance(dt, datetime.datetime)
 
-    date_provider = registry.get("date")
+    date_provider = default_registry.get("date")
     assert date_provider is not None
     d = date_provider.func(
         summary=FieldSummary(type="date", constraints=FieldConstraints()), faker=faker
     )
     assert isinstance(d, datetime.date)
 
-    time_provider = registry.get("time")
+    time_provider = default_registry.get("time")
     assert time_provider is not None
     t = time_provider.func(
         summary=FieldSummary(type="time", constraints=FieldConstraints()), faker=faker
@@ -499,27 +515,21 @@ def test_temporal_provider_outputs_types() -> None:
     assert isinstance(t, datetime.time)
 
 
-def test_string_provider_secret_bytes() -> None:
-    registry = ProviderRegistry()
-    register_string_providers(registry)
-    provider = registry.get("string")
+def test_string_provider_secret_bytes(default_registry: ProviderRegistry) -> None:
+    provider = default_registry.get("string")
     assert provider is not None
 
     summary = schema_module.summarize_model_fields(SecretsExample)
-    value = provider.func(summary=summary["token"], faker=Faker(seed=3))
+    value = provider.func(summary=summary["token"], faker=_seeded_faker(3))
     assert isinstance(value, bytes)
     assert len(value) > 0
 
-    password = provider.func(summary=summary["password"], faker=Faker(seed=4))
+    password = provider.func(summary=summary["password"], faker=_seeded_faker(4))
     assert isinstance(password, str)
     assert len(password) > 0
 
 
-def test_string_provider_temporal_and_uuid() -> None:
-    registry = ProviderRegistry()
-    register_identifier_providers(registry)
-    register_temporal_providers(registry)
-
+def test_string_provider_temporal_and_uuid(default_registry: ProviderRegistry) -> None:
     class TemporalModel(BaseModel):
         identifier: uuid.UUID
         created_at: datetime.datetime
@@ -527,37 +537,37 @@ def test_string_provider_temporal_and_uuid() -> None:
         wake_up: datetime.time
 
     summary = schema_module.summarize_model_fields(TemporalModel)
-    faker = Faker(seed=5)
+    faker = _seeded_faker(5)
 
-    uuid_provider = registry.get("uuid")
+    uuid_provider = default_registry.get("uuid")
     assert uuid_provider is not None
     identifier = uuid_provider.func(
         summary=summary["identifier"],
         faker=faker,
-        random_generator=random.Random(13),
+        random_generator=_seeded_rng(13),
     )
     assert isinstance(identifier, uuid.UUID)
 
-    datetime_provider = registry.get("datetime")
+    datetime_provider = default_registry.get("datetime")
     assert datetime_provider is not None
     created = datetime_provider.func(summary=summary["created_at"], faker=faker)
     assert isinstance(created, datetime.datetime)
 
-    birthday_provider = registry.get("date")
+    birthday_provider = default_registry.get("date")
     assert birthday_provider is not None
     birthday = birthday_provider.func(summary=summary["birthday"], faker=faker)
     assert isinstance(birthday, datetime.date)
 
-    wake_provider = registry.get("time")
+    wake_provider = default_registry.get("time")
     assert wake_provider is not None
     wake = wake_provider.func(summary=summary["wake_up"], faker=faker)
     assert isinstance(wake, datetime.time)
 
 
-def test_string_provider_regex_padding(monkeypatch: pytest.MonkeyPatch) -> None:
-    registry = ProviderRegistry()
-    register_string_providers(registry)
-    provider = registry.get("string")
+def test_string_provider_regex_padding(
+    monkeypatch: pytest.MonkeyPatch, default_registry: ProviderRegistry
+) -> None:
+    provider = default_registry.get("string")
     assert provider is not None
 
     class DummyRstr:
@@ -565,25 +575,25 @@ def test_string_provider_regex_padding(monkeypatch: pytest.MonkeyPatch) -> None:
         def xeger(pattern: str) -> str:
             return "ABCDEFG"  # intentionally longer than allowed
 
-    monkeypatch.setattr(strings_module, "rstr", DummyRstr())
+    monkeypatch.setitem(strings_module._MODULE_CACHE, "rstr", DummyRstr())
 
     summary = FieldSummary(
         type="string",
         constraints=FieldConstraints(min_length=5, max_length=6, pattern="^AB"),
         format=None,
     )
-    value = provider.func(summary=summary, faker=Faker(seed=7))
+    value = provider.func(summary=summary, faker=_seeded_faker(7))
     assert value.startswith("AB")
     assert len(value) == summary.constraints.max_length
 
-    monkeypatch.setattr(strings_module, "rstr", None)
+    monkeypatch.setitem(strings_module._MODULE_CACHE, "rstr", None)
 
     empty_pattern_summary = FieldSummary(
         type="string",
         constraints=FieldConstraints(min_length=4, max_length=5, pattern="^$"),
         format=None,
     )
-    generated = provider.func(summary=empty_pattern_summary, faker=Faker(seed=8))
+    generated = provider.func(summary=empty_pattern_summary, faker=_seeded_faker(8))
     assert 4 <= len(generated) <= 5
 
     adjusted_summary = FieldSummary(
@@ -591,14 +601,12 @@ def test_string_provider_regex_padding(monkeypatch: pytest.MonkeyPatch) -> None:
         constraints=FieldConstraints(min_length=7, max_length=5),
         format=None,
     )
-    adjusted_value = provider.func(summary=adjusted_summary, faker=Faker(seed=9))
+    adjusted_value = provider.func(summary=adjusted_summary, faker=_seeded_faker(9))
     assert len(adjusted_value) == 5
 
 
-def test_slug_provider_respects_length_constraints() -> None:
-    registry = ProviderRegistry()
-    register_string_providers(registry)
-    provider = registry.get("slug")
+def test_slug_provider_respects_length_constraints(default_registry: ProviderRegistry) -> None:
+    provider = default_registry.get("slug")
     assert provider is not None
 
     summary = FieldSummary(
@@ -606,21 +614,18 @@ def test_slug_provider_respects_length_constraints() -> None:
         constraints=FieldConstraints(min_length=4, max_length=12),
         format=None,
     )
-    value = provider.func(summary=summary, faker=Faker(seed=12))
+    value = provider.func(summary=summary, faker=_seeded_faker(12))
     assert 4 <= len(value) <= 12
     assert value == value.lower()
     assert " " not in value
 
 
-def test_temporal_provider_uses_anchor() -> None:
-    registry = ProviderRegistry()
-    register_temporal_providers(registry)
-
+def test_temporal_provider_uses_anchor(default_registry: ProviderRegistry) -> None:
     anchor = datetime.datetime(2025, 1, 1, 12, 30, 45, tzinfo=datetime.timezone.utc)
-    faker = Faker(seed=10)
+    faker = _seeded_faker(10)
 
     datetime_summary = FieldSummary(type="datetime", constraints=FieldConstraints())
-    datetime_provider = registry.get("datetime")
+    datetime_provider = default_registry.get("datetime")
     assert datetime_provider is not None
     datetime_value = datetime_provider.func(
         summary=datetime_summary,
@@ -630,7 +635,7 @@ def test_temporal_provider_uses_anchor() -> None:
     assert datetime_value == anchor
 
     date_summary = FieldSummary(type="date", constraints=FieldConstraints())
-    date_provider = registry.get("date")
+    date_provider = default_registry.get("date")
     assert date_provider is not None
     date_value = date_provider.func(
         summary=date_summary,
@@ -640,7 +645,7 @@ def test_temporal_provider_uses_anchor() -> None:
     assert date_value == anchor.date()
 
     time_summary = FieldSummary(type="time", constraints=FieldConstraints())
-    time_provider = registry.get("time")
+    time_provider = default_registry.get("time")
     assert time_provider is not None
     time_value = time_provider.func(summary=time_summary, faker=faker, time_anchor=anchor)
     assert time_value.isoformat() == anchor.timetz().isoformat()
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import gc
 import uuid
+import weakref
 from collections.abc import Callable
 from dataclasses import field as dc_field
 from decimal import Decimal
@@ -18,6 +20,7 @@ import email_validator  # noqa: F401
 import pytest
 from pydantic import AnyUrl, BaseModel, Field, SecretBytes, SecretStr
 from pydantic_fixturegen.core import schema as schema_module
+from pydantic_fixturegen.core.forward_refs import configure_forward_refs
 from pydantic_fixturegen.core.schema import (
     FieldConstraints,
     extract_constraints,
@@ -159,6 +162,65 @@ def test_summarize_field_basic() -> None:
     assert summary["upper"].constraints.le == 50
 
 
+def test_summarize_model_fields_caches_per_model() -> None:
+    first = schema_module.summarize_model_fields(NumericModel)
+    second = schema_module.summarize_model_fields(NumericModel)
+
+    assert second is first
+    with pytest.raises(TypeError):
+        first["score"] = first["upper"]  # type: ignore[index]
+
+
+def test_summarize_model_fields_refreshes_after_rebuild() -> None:
+    class Parent(BaseModel):
+        child: LaterChild  # type: ignore[name-defined]  # noqa: F821
+
+    before = schema_module.summarize_model_fields(Parent)
+
+    class LaterChild(BaseModel):
+        value: int
+
+    Parent.model_rebuild(_types_namespace={"LaterChild": LaterChild})
+    after = schema_module.summarize_model_fields(Parent)
+
+    assert after is not before
+    assert after["child"].type == "model"
+
+
+def test_summarize_model_fields_refreshes_after_forward_ref_config() -> None:
+    first = schema_module.summarize_model_fields(NumericModel)
+
+    configure_forward_refs(())
+
+    assert schema_module.summarize_model_fields(NumericModel) is not first
+
+
+def test_summarize_model_fields_does_not_retain_recursive_models() -> None:
+    class Node(BaseModel):
+        children: list[Node]  # noqa: F821
+
+    Node.model_rebuild(_types_namespace={"Node": Node})
+    summary = schema_module.summarize_model_fields(Node)
+    assert summary["children"].item_type == "model"
+
+    node_ref = weakref.ref(Node)
+    del Node, summary
+    gc.collect()
+
+    assert node_ref() is None
+
+
+def test_summarize_model_fields_does_not_reuse_parent_summary() -> None:
+    class Base(BaseModel):
+        value: int
+
+    class Child(Base):
+        extra: str
+
+    assert list(schema_module.summarize_model_fields(Base)) == ["value"]
+    assert list(schema_module.summarize_model_fields(Child)) == ["value", "extra"]
+
+
 def test_summarize_field_for_list() -> None:
     class CollectionModel(BaseModel):
         tags: Annotated[list[str], Field(min_length=1)]
@@ -284,6 +346,8 @@ def test_summarize_model_fields_supports_dataclass_metadata() -> None:
 
     summaries = summarize_model_fields(DataClassExample)
     assert summaries["alias"].default_factory is not None
+    with pytest.raises(TypeError):
+        summaries["code"] = summaries["alias"]  # type: ignore[index]
 
 
 def test_summarize_model_fields_supports_typeddict_optionals() -> None:
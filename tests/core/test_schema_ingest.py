@@ -5,7 +5,7 @@ import json
 import sys
 from contextlib import contextmanager
 from pathlib import Path
-from types import ModuleType
+from types import ModuleType, SimpleNamespace
 
 import pytest
 from pydantic_fixturegen.core import schema_ingest
@@ -35,14 +35,17 @@ class _DummyDCG:
         output.write_text("# generated via DCG\nclass Example:\n    pass\n", encoding="utf-8")
 
 
-def _patch_dcg(monkeypatch: pytest.MonkeyPatch, dcg_obj: object) -> None:
+def _patch_dcg(monkeypatch: pytest.MonkeyPatch, dcg_obj: type[_DummyDCG]) -> None:
     def fake_import(name: str):
         if name == "datamodel_code_generator":
             return dcg_obj
         return importlib.import_module(name)
 
+    # Rebind only schema_ingest's ``importlib`` name; patching importlib.import_module
+    # itself would intercept every import in the process for the test's duration.
     monkeypatch.setattr(schema_ingest, "_ensure_pydantic_compatibility", _noop_context)
-    monkeypatch.setattr(schema_ingest.importlib, "import_module", fake_import)
+    monkeypatch.setattr(schema_ingest, "importlib", SimpleNamespace(import_module=fake_import))
+    monkeypatch.setattr(schema_ingest, "_DCG_VERSION", dcg_obj.__version__)
 
 
 def test_schema_ingester_invokes_datamodel_code_generator(
@@ -50,7 +53,6 @@ def test_schema_ingester_invokes_datamodel_code_generator(
     tmp_path: Path,
 ) -> None:
     _patch_dcg(monkeypatch, _DummyDCG)
-    schema_ingest._DCG_VERSION = _DummyDCG.__version__
     ingester = schema_ingest.SchemaIngester(root=tmp_path)
     schema_file = tmp_path / "schema.json"
     schema_file.write_text('{"title": "Example"}', encoding="utf-8")
@@ -65,6 +67,36 @@ def test_schema_ingester_invokes_datamodel_code_generator(
     assert cached.path == module.path
 
 
+def test_schema_ingester_reuses_modules_from_previous_runs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _patch_dcg(monkeypatch, _DummyDCG)
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text('{"title": "Example"}', encoding="utf-8")
+    first = schema_ingest.SchemaIngester(root=tmp_path).ingest_json_schema(schema_file)
+
+    # A fresh process resolves the version from distribution metadata again.
+    monkeypatch.setattr(schema_ingest, "_DCG_VERSION", None)
+    monkeypatch.setattr(
+        schema_ingest,
+        "metadata",
+        SimpleNamespace(
+            version=lambda name: _DummyDCG.__version__,
+            PackageNotFoundError=LookupError,
+        ),
+    )
+
+    def fail_generate(**kwargs: object) -> None:
+        raise AssertionError("cached module should be reused")
+
+    monkeypatch.setattr(_DummyDCG, "generate", staticmethod(fail_generate))
+    second = schema_ingest.SchemaIngester(root=tmp_path).ingest_json_schema(schema_file)
+
+    assert second.path == first.path
+    assert second.cache_key == first.cache_key
+
+
 class _FailingDCG(_DummyDCG):
     @staticmethod
     def generate(**kwargs):
@@ -73,7 +105,6 @@ class _FailingDCG(_DummyDCG):
 
 def test_schema_ingester_fallback_compiler(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     _patch_dcg(monkeypatch, _FailingDCG)
-    schema_ingest._DCG_VERSION = _FailingDCG.__version__
     ingester = schema_ingest.SchemaIngester(root=tmp_path)
     schema_file = tmp_path / "schema.json"
     schema_file.write_text('{"title": "FallbackModel", "type": "object"}', encoding="utf-8")
@@ -88,7 +119,6 @@ def test_schema_ingester_ingest_openapi_writes_override(
     tmp_path: Path,
 ) -> None:
     _patch_dcg(monkeypatch, _DummyDCG)
-    schema_ingest._DCG_VERSION = _DummyDCG.__version__
     ingester = schema_ingest.SchemaIngester(root=tmp_path)
     spec_path = tmp_path / "spec.yaml"
     spec_path.write_text("openapi: 3.1.0", encoding="utf-8")
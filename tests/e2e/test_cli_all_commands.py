@@ -6,6 +6,8 @@ from pathlib import Path
 from pydantic_fixturegen.cli import app as cli_app
 from tests._cli import create_cli_runner
 
+runner = create_cli_runner()
+
 LIST_MODULE = """
 from pydantic import BaseModel
 
@@ -28,8 +30,6 @@ def _write_module(tmp_path: Path, content: str = LIST_MODULE, name: str = "model
 
 def test_list_command_outputs_models(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path)
-    runner = create_cli_runner()
-
     result = runner.invoke(cli_app, ["list", str(module_path)])
 
     assert result.exit_code == 0, result.output
@@ -39,8 +39,6 @@ def test_list_command_outputs_models(tmp_path: Path) -> None:
 
 def test_explain_command_emits_json(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path)
-    runner = create_cli_runner()
-
     result = runner.invoke(
         cli_app,
         [
@@ -61,8 +59,6 @@ def test_explain_command_emits_json(tmp_path: Path) -> None:
 
 def test_doctor_command_reports_success(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path)
-    runner = create_cli_runner()
-
     result = runner.invoke(
         cli_app,
         [
@@ -85,8 +81,6 @@ class User(BaseModel):
 """
 
     module_path = _write_module(tmp_path, source)
-    runner = create_cli_runner()
-
     result = runner.invoke(
         cli_app,
         [
@@ -103,7 +97,6 @@ class User(BaseModel):
 
 
 def test_schema_config_command_writes_file(tmp_path: Path) -> None:
-    runner = create_cli_runner()
     out_path = tmp_path / "schema" / "config.json"
 
     result = runner.invoke(
@@ -122,7 +115,6 @@ def test_schema_config_command_writes_file(tmp_path: Path) -> None:
 
 
 def test_init_scaffolds_configuration(tmp_path: Path) -> None:
-    runner = create_cli_runner()
     result = runner.invoke(
         cli_app,
         [
@@ -145,7 +137,6 @@ def test_init_scaffolds_configuration(tmp_path: Path) -> None:
 
 
 def test_plugin_new_scaffolds_project(tmp_path: Path) -> None:
-    runner = create_cli_runner()
     target = tmp_path / "plugins" / "demo"
 
     result = runner.invoke(
@@ -176,8 +167,6 @@ def test_plugin_new_scaffolds_project(tmp_path: Path) -> None:
 def test_check_command_reports_success(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path)
     fixtures_path = tmp_path / "fixtures.py"
-    runner = create_cli_runner()
-
     result = runner.invoke(
         cli_app,
         [
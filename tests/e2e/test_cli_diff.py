@@ -5,6 +5,8 @@ from pathlib import Path
 from pydantic_fixturegen.cli import app as cli_app
 from tests._cli import create_cli_runner
 
+runner = create_cli_runner()
+
 MODULE_SOURCE = """
 from pydantic import BaseModel
 
@@ -23,7 +25,6 @@ def _write_module(tmp_path: Path) -> Path:
 
 def test_diff_reports_drift_and_shows_unified_diff(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path)
-    runner = create_cli_runner()
     fixtures_path = tmp_path / "fixtures" / "test_models.py"
 
     gen_result = runner.invoke(
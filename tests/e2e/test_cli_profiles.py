@@ -6,6 +6,8 @@ from pathlib import Path
 from pydantic_fixturegen.cli import app as cli_app
 from tests._cli import create_cli_runner
 
+runner = create_cli_runner()
+
 SENSITIVE_MODULE = """
 from pydantic import BaseModel, AnyUrl
 
@@ -36,7 +38,6 @@ def _write_module(tmp_path: Path, name: str, source: str) -> Path:
 
 def test_gen_json_profile_pii_safe_masks_sensitive_fields(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path, "contacts", SENSITIVE_MODULE)
-    runner = create_cli_runner()
     output = tmp_path / "contact_fixtures.py"
 
     result = runner.invoke(
@@ -63,7 +64,6 @@ def test_gen_json_profile_pii_safe_masks_sensitive_fields(tmp_path: Path) -> Non
 
 def test_profiles_change_fixture_outputs(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path, "contacts", SENSITIVE_MODULE)
-    runner = create_cli_runner()
     safe_out = tmp_path / "safe.py"
     default_out = tmp_path / "default.py"
 
@@ -110,7 +110,6 @@ def test_profiles_change_fixture_outputs(tmp_path: Path) -> None:
 
 def test_json_command_supports_many_flags(tmp_path: Path) -> None:
     module_path = _write_module(tmp_path, "inventory", MULTI_MODEL_SOURCE)
-    runner = create_cli_runner()
     output_base = tmp_path / "samples.jsonl"
     freeze_file = tmp_path / "custom-seeds.json"
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import json
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -12,6 +14,8 @@ from pydantic_fixturegen.testing import (
 )
 from tests._cli import create_cli_runner
 
+runner = create_cli_runner()
+
 BASIC_MODULE = """
 from pydantic import BaseModel
 
@@ -65,15 +69,36 @@ RecursiveNode.model_rebuild()
 """
 
 
-def _write_module(tmp_path: Path, source: str, name: str = "models") -> Path:
-    module_path = tmp_path / f"{name}.py"
-    module_path.write_text(source, encoding="utf-8")
-    return module_path
+@pytest.fixture(scope="module")
+def write_module(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Path]:
+    """Write model sources once per module, keyed by name and content hash.
+
+    Tests here only read the module, so identical sources share one path (and one
+    ``__pycache__`` entry) instead of being rewritten and recompiled per test.
+    """
+
+    cache_root = tmp_path_factory.mktemp("modcache")
+    cache: dict[tuple[str, str], Path] = {}
 
+    def write(source: str, name: str = "models") -> Path:
+        digest = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+        key = (name, digest)
+        module_path = cache.get(key)
+        if module_path is None:
+            module_dir = cache_root / f"{name}-{digest}"
+            module_dir.mkdir()
+            module_path = module_dir / f"{name}.py"
+            module_path.write_text(source, encoding="utf-8")
+            cache[key] = module_path
+        return module_path
 
-def test_gen_json_with_freeze_seeds_is_stable(tmp_path: Path) -> None:
-    module_path = _write_module(tmp_path, BASIC_MODULE)
-    runner = create_cli_runner()
+    return write
+
+
+def test_gen_json_with_freeze_seeds_is_stable(
+    write_module: Callable[..., Path], tmp_path: Path
+) -> None:
+    module_path = write_module(BASIC_MODULE)
     output = tmp_path / "snapshots" / "user.json"
     freeze_file = tmp_path / "custom-freeze.json"
 
@@ -123,9 +148,10 @@ def test_gen_json_with_freeze_seeds_is_stable(tmp_path: Path) -> None:
     assert output.read_bytes() == snapshot_bytes
 
 
-def test_schema_generation_with_templates(tmp_path: Path) -> None:
-    module_path = _write_module(tmp_path, SCHEMA_MODULE, name="domain")
-    runner = create_cli_runner()
+def test_schema_generation_with_templates(
+    write_module: Callable[..., Path], tmp_path: Path
+) -> None:
+    module_path = write_module(SCHEMA_MODULE, name="domain")
     schema_template = tmp_path / "schemas" / "{model}.json"
 
     for include_pattern in ("domain.User", "domain.Order"):
@@ -154,7 +180,6 @@ def test_schema_generation_with_templates(tmp_path: Path) -> None:
 
 
 def test_check_reports_json_error_payload() -> None:
-    runner = create_cli_runner()
     result = runner.invoke(
         cli_app,
         ["check", "--json-errors", "missing_module.py"],
@@ -165,9 +190,10 @@ def test_check_reports_json_error_payload() -> None:
     assert payload["error"]["kind"] == "DiscoveryError"
 
 
-def test_snapshot_runner_validates_cli_snapshots(tmp_path: Path) -> None:
-    module_path = _write_module(tmp_path, BASIC_MODULE)
-    runner = create_cli_runner()
+def test_snapshot_runner_validates_cli_snapshots(
+    write_module: Callable[..., Path], tmp_path: Path
+) -> None:
+    module_path = write_module(BASIC_MODULE)
     snapshot_path = tmp_path / "snapshots" / "user.json"
 
     gen_result = runner.invoke(
@@ -206,9 +232,10 @@ def test_snapshot_runner_validates_cli_snapshots(tmp_path: Path) -> None:
         )
 
 
-def test_numeric_distribution_env_controls(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    module_path = _write_module(tmp_path, FLOAT_SAMPLE_MODULE)
-    runner = create_cli_runner()
+def test_numeric_distribution_env_controls(
+    write_module: Callable[..., Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module_path = write_module(FLOAT_SAMPLE_MODULE)
     output = tmp_path / "readings.json"
 
     monkeypatch.setenv("PFG_NUMBERS__DISTRIBUTION", "spike")
@@ -238,10 +265,8 @@ def test_numeric_distribution_env_controls(tmp_path: Path, monkeypatch: pytest.M
     assert all(0.48 <= reading <= 0.52 for reading in readings)
 
 
-def test_explain_reports_heuristic_metadata(tmp_path: Path) -> None:
-    module_path = _write_module(tmp_path, HEURISTIC_MODULE, name="catalog")
-    runner = create_cli_runner()
-
+def test_explain_reports_heuristic_metadata(write_module: Callable[..., Path]) -> None:
+    module_path = write_module(HEURISTIC_MODULE, name="catalog")
     result = runner.invoke(
         cli_app,
         [
@@ -276,9 +301,10 @@ def test_explain_reports_heuristic_metadata(tmp_path: Path) -> None:
     assert path_heuristic and path_heuristic["rule"] == "path-directory"
 
 
-def test_gen_json_generates_values_for_heuristic_fields(tmp_path: Path) -> None:
-    module_path = _write_module(tmp_path, HEURISTIC_MODULE, name="catalog")
-    runner = create_cli_runner()
+def test_gen_json_generates_values_for_heuristic_fields(
+    write_module: Callable[..., Path], tmp_path: Path
+) -> None:
+    module_path = write_module(HEURISTIC_MODULE, name="catalog")
     output = tmp_path / "catalog.json"
 
     result = runner.invoke(
@@ -308,9 +334,10 @@ def test_gen_json_generates_values_for_heuristic_fields(tmp_path: Path) -> None:
     assert "/" in sample["data_dir"] or "\\" in sample["data_dir"]
 
 
-def test_json_generation_includes_cycle_metadata(tmp_path: Path) -> None:
-    module_path = _write_module(tmp_path, RECURSIVE_MODULE, name="recursive")
-    runner = create_cli_runner()
+def test_json_generation_includes_cycle_metadata(
+    write_module: Callable[..., Path], tmp_path: Path
+) -> None:
+    module_path = write_module(RECURSIVE_MODULE, name="recursive")
     output = tmp_path / "recursive.json"
 
     result = runner.invoke(
@@ -5,7 +5,6 @@ from pathlib import Path
 from types import ModuleType, SimpleNamespace
 
 import pytest
-from fastapi.testclient import TestClient  # type: ignore
 from pydantic_fixturegen.cli import app as cli_app
 from pydantic_fixturegen.cli.fastapi import (
     _import_object,
@@ -78,10 +77,11 @@ def test_fastapi_mock_server_builds_app(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
+    testclient = pytest.importorskip("fastapi.testclient")
     _write_app(tmp_path)
     monkeypatch.syspath_prepend(tmp_path)
     app = build_mock_app(target="my_app:app", seed=1)
-    client = TestClient(app)
+    client = testclient.TestClient(app)
 
     response = client.get("/items")
     assert response.status_code == 200
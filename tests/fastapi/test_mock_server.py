@@ -13,8 +13,6 @@ from pydantic_fixturegen.fastapi_support.mock import (
     build_mock_app,
 )
 
-from fastapi import FastAPI  # noqa: F401
-
 
 class _DummyGenerator:
     def __init__(self, value: BaseModel | None) -> None:
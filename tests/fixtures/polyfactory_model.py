@@ -0,0 +1,23 @@
+"""Polyfactory module consumed by ``pfg polyfactory migrate`` tests."""
+
+from __future__ import annotations
+
+from polyfactory.factories.pydantic_factory import ModelFactory
+from polyfactory.fields import Ignore, Use
+from pydantic import BaseModel
+
+
+def slugify(prefix: str) -> str:
+    return f"{prefix}-slug"
+
+
+class Model(BaseModel):
+    slug: str
+    alias: str | None = None
+
+
+class ModelFactoryShim(ModelFactory[Model]):
+    __model__ = Model
+    __check_model__ = False
+    slug = Use(slugify, "fixture")
+    alias = Ignore()
@@ -111,6 +111,17 @@ def test_resolve_target_supports_dot_paths() -> None:
     assert target.__name__ == _ConfigurableHandler.__name__
 
 
+def test_resolve_target_caches_resolved_paths() -> None:
+    registry_mod._resolve_target.cache_clear()
+    path = "tests.persistence_helpers:SyncCaptureHandler"
+
+    first = registry_mod._resolve_target(path)
+    second = registry_mod._resolve_target(path)
+
+    assert second is first
+    assert registry_mod._resolve_target.cache_info().hits == 1
+
+
 def test_registry_create_unknown_handler() -> None:
     registry = PersistenceRegistry()
     with pytest.raises(KeyError):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 import pytest
@@ -7,6 +8,7 @@ from pydantic import BaseModel
 from pydantic_fixturegen.api.models import ConfigSnapshot
 from pydantic_fixturegen.core.errors import PersistenceError
 from pydantic_fixturegen.logging import get_logger
+from pydantic_fixturegen.persistence.models import PersistenceRecord
 from pydantic_fixturegen.persistence.runner import PersistenceRunner
 from tests.persistence_helpers import (
     AsyncCaptureHandler,
@@ -58,6 +60,37 @@ def test_persistence_runner_sync_batches() -> None:
     assert stats.retries == 0
 
 
+def test_persistence_runner_numbers_cases_across_batches() -> None:
+    batches: list[Sequence[PersistenceRecord]] = []
+
+    class RecordingHandler:
+        def persist_batch(self, batch: Sequence[PersistenceRecord]) -> None:
+            batches.append(batch)
+
+    runner = PersistenceRunner(
+        handler=RecordingHandler(),
+        handler_kind="sync",
+        handler_name="recording",
+        sample_factory=_factory,
+        model_cls=SampleModel,
+        related_models=(),
+        count=5,
+        batch_size=2,
+        max_retries=1,
+        retry_wait=0.0,
+        logger=get_logger(),
+        warnings=(),
+        config_snapshot=_snapshot(),
+        options={},
+    )
+
+    runner.run()
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [record.case_index for batch in batches for record in batch] == [1, 2, 3, 4, 5]
+    assert {record.model for batch in batches for record in batch} == {"SampleModel"}
+
+
 def test_persistence_runner_retries() -> None:
     handler = FlakyHandler(fail_times=1)
     runner = PersistenceRunner(
@@ -20,10 +20,8 @@ def _summary(
 
 class ScenarioRandom(random.Random):
     def choice(self, seq):  # type: ignore[override]
-        if isinstance(seq, tuple) and all(getattr(item, "root", None) == "/" for item in seq):
-            from pathlib import PurePosixPath
-
-            return PurePosixPath("/home")
+        if seq is paths._POSIX_ROOTS:
+            return paths._POSIX_HOME
         if seq == ("users", "applications", "volumes"):
             return "users"
         return super().choice(seq)
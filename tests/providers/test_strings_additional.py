@@ -9,7 +9,7 @@ from pytest import MonkeyPatch
 
 
 def test_generate_string_regex_fallback(monkeypatch: MonkeyPatch) -> None:
-    monkeypatch.setattr(strings, "rstr", None)
+    monkeypatch.setitem(strings._MODULE_CACHE, "rstr", None)
     summary = FieldSummary(
         type="string",
         constraints=FieldConstraints(pattern="^abc$", min_length=3, max_length=5),